@@ -0,0 +1,4 @@
+from src.user_interaction import user_interaction
+
+if __name__ == "__main__":
+    user_interaction()
@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HeadHunterAPIBase(ABC):
+    """Абстрактный класс для работы с API сервисов вакансий."""
+
+    def __init__(self) -> None:
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"User-Agent": "SkyPro-JobSearch/1.0", "Accept-Encoding": "gzip"}
+        )
+
+    @abstractmethod
+    def get_vacancies(self, search_query: str) -> list[dict[str, Any]]:
+        """Возвращает список вакансий по поисковому запросу."""
+
+
+class HeadHunterAPI(HeadHunterAPIBase):
+    """Клиент API HH.ru для получения вакансий."""
+
+    BASE_URL = "https://api.hh.ru/vacancies"
+
+    def _request(
+        self, url: str, params: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        """Выполняет GET-запрос и возвращает разобранный JSON или None."""
+        try:
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def get_vacancies(
+        self, search_query: str, per_page: int = 100, max_pages: int = 20
+    ) -> list[dict[str, Any]]:
+        """Возвращает вакансии HH.ru по поисковому запросу.
+
+        Первая страница запрашивается синхронно, чтобы узнать общее
+        число страниц; остальные (до лимита max_pages) загружаются
+        параллельно — запросы к API ограничены сетью, а не процессором.
+        """
+        params = {"text": search_query, "per_page": per_page}
+        data = self._request(self.BASE_URL, {**params, "page": 0})
+        if not data:
+            return []
+        all_vacancies: list[dict[str, Any]] = list(data.get("items", []))
+        pages = min(max_pages, data.get("pages", 0))
+        if pages <= 1:
+            return all_vacancies
+        with ThreadPoolExecutor(max_workers=min(8, pages - 1)) as executor:
+            futures = [
+                executor.submit(self._request, self.BASE_URL, {**params, "page": page})
+                for page in range(1, pages)
+            ]
+            for future in futures:
+                page_data = future.result()
+                if page_data:
+                    all_vacancies.extend(page_data.get("items", []))
+        return all_vacancies
@@ -0,0 +1,165 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Optional
+
+import orjson
+
+from src.vacancy import Vacancy
+
+
+class VacancySaverBase(ABC):
+    """Абстрактный класс для сохранения вакансий в файл."""
+
+    @abstractmethod
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавляет вакансию в файл."""
+
+    @abstractmethod
+    def get_vacancies(self, criteria: Optional[dict[str, Any]] = None) -> list[Vacancy]:
+        """Возвращает вакансии, удовлетворяющие критериям."""
+
+    @abstractmethod
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """Удаляет вакансию из файла."""
+
+
+class JSONSaver(VacancySaverBase):
+    """Сохраняет вакансии в JSON-файл."""
+
+    def __init__(self, filename: str = "data/vacancies.json") -> None:
+        self._filename = filename
+        self._cache: Optional[list[dict[str, Any]]] = None
+        self._cache_mtime: float = -1.0
+        self._index: dict[str, int] = {}
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _load_vacancies(self) -> list[dict[str, Any]]:
+        """Загружает список вакансий из файла.
+
+        Разобранный список кэшируется в памяти и переиспользуется, пока
+        mtime файла не изменится, поэтому повторные чтения не трогают диск.
+        """
+        try:
+            mtime = os.stat(self._filename).st_mtime
+        except OSError:
+            self._index = {}
+            return []
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+        try:
+            with open(self._filename, "rb") as f:
+                data = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            self._index = {}
+            return []
+        if not isinstance(data, list):
+            self._index = {}
+            return []
+        self._cache = data
+        self._cache_mtime = mtime
+        self._rebuild_index(data)
+        return data
+
+    def _save_vacancies(self, vacancies: list[dict[str, Any]]) -> None:
+        """Атомарно сохраняет список вакансий в файл и обновляет кэш.
+
+        Данные пишутся во временный файл рядом с целевым и подменяются
+        одним os.replace, поэтому на диске всегда лежит либо прежнее,
+        либо новое полное состояние — обрыв записи не портит файл.
+        """
+        tmp = f"{self._filename}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    vacancies, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._filename)
+        self._cache = vacancies
+        self._cache_mtime = os.stat(self._filename).st_mtime
+        self._rebuild_index(vacancies)
+
+    def _rebuild_index(self, vacancies: list[dict[str, Any]]) -> None:
+        """Перестраивает индекс id -> позиция в списке вакансий."""
+        self._index = {
+            item["id"]: position
+            for position, item in enumerate(vacancies)
+            if "id" in item
+        }
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавляет вакансию в файл, пропуская дубликаты по id."""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: list[Vacancy]) -> None:
+        """Добавляет список вакансий в файл за одну запись.
+
+        Файл читается и записывается по одному разу независимо от числа
+        вакансий, дубликаты отсеиваются по множеству id.
+        """
+        existing = self._load_vacancies()
+        seen = {item.get("id") for item in existing}
+        added = False
+        for vacancy in vacancies:
+            if vacancy.id in seen:
+                continue
+            existing.append(vacancy.to_dict())
+            seen.add(vacancy.id)
+            added = True
+        if added:
+            self._save_vacancies(existing)
+
+    def get_vacancies(self, criteria: Optional[dict[str, Any]] = None) -> list[Vacancy]:
+        """Возвращает вакансии из файла, отфильтрованные по критериям.
+
+        Поддерживаемые критерии: keyword (подстрока в названии или
+        требованиях), salary_from и salary_to (границы зарплаты).
+        """
+        if not criteria:
+            return [Vacancy.from_dict(item) for item in self._load_vacancies()]
+        return list(self._iter_vacancies(criteria))
+
+    def _iter_vacancies(self, criteria: dict[str, Any]) -> Iterator[Vacancy]:
+        """Итерирует вакансии, удовлетворяющие критериям.
+
+        Критерии проверяются по словарям до создания объектов Vacancy,
+        поэтому отфильтрованные записи не тратят работу конструктора.
+        """
+        keyword = criteria.get("keyword", "").lower() or None
+        salary_from = criteria.get("salary_from") or 0
+        salary_to = criteria.get("salary_to")
+        for item in self._load_vacancies():
+            if keyword:
+                haystack = (
+                    (item.get("name") or "").lower()
+                    + "\x00"
+                    + (item.get("requirements") or "").lower()
+                )
+                if keyword not in haystack:
+                    continue
+            if (item.get("salary_from") or 0) < salary_from:
+                continue
+            if salary_to is not None and (item.get("salary_to") or 0) > salary_to:
+                continue
+            yield Vacancy.from_dict(item)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """Удаляет вакансию из файла по её id.
+
+        Позиция находится по индексу за O(1) вместо линейного прохода
+        по всему списку.
+        """
+        vacancies = self._load_vacancies()
+        position = self._index.get(vacancy.id)
+        if position is None:
+            return
+        del vacancies[position]
+        self._save_vacancies(vacancies)
+
+    def clear(self) -> None:
+        """Удаляет все вакансии из файла."""
+        self._save_vacancies([])
@@ -0,0 +1,82 @@
+import sys
+
+from src.api_hh import HeadHunterAPI
+from src.json_saver import JSONSaver
+from src.utils import (
+    get_top_vacancies,
+    get_vacancies_by_salary,
+    print_vacancies,
+)
+from src.vacancy import Vacancy
+
+_BANNER = "Добро пожаловать в программу поиска вакансий!\n"
+
+_MENU = (
+    "\nМЕНЮ:\n"
+    "1. Найти вакансии на HH.ru\n"
+    "2. Показать сохранённые вакансии\n"
+    "3. Поиск по ключевому слову\n"
+    "4. Топ N вакансий по зарплате\n"
+    "5. Фильтр по диапазону зарплат\n"
+    "6. Очистить сохранённые вакансии\n"
+    "0. Выход\n"
+)
+
+
+def user_interaction(skip_continue_prompt: bool = False) -> None:
+    """Запускает интерактивное меню для работы с вакансиями.
+
+    skip_continue_prompt отключает паузу «Нажмите Enter...» после
+    каждого действия — тестам не приходится скармливать пустую строку
+    на каждую итерацию меню.
+    """
+    api = HeadHunterAPI()
+    saver = JSONSaver()
+    sys.stdout.write(_BANNER)
+    while True:
+        sys.stdout.write(_MENU)
+        choice = input("Выберите пункт меню: ").strip()
+
+        if choice == "0":
+            print("До свидания!")
+            break
+        elif choice == "1":
+            query = input("Введите поисковый запрос: ").strip()
+            if not query:
+                print("Запрос не может быть пустым.")
+            else:
+                data = api.get_vacancies(query)
+                if not data:
+                    print("По запросу ничего не найдено.")
+                else:
+                    vacancies = Vacancy.cast_to_object_list(data)
+                    saver.add_vacancies(vacancies)
+                    print_vacancies(vacancies)
+        elif choice == "2":
+            print_vacancies(saver.get_vacancies())
+        elif choice == "3":
+            keyword = input("Введите ключевое слово: ").strip()
+            print_vacancies(saver.get_vacancies({"keyword": keyword}))
+        elif choice == "4":
+            try:
+                top_n = int(input("Сколько вакансий показать: ").strip())
+            except ValueError:
+                print("Некорректное число.")
+            else:
+                print_vacancies(get_top_vacancies(saver.get_vacancies(), top_n))
+        elif choice == "5":
+            salary_range = input(
+                "Введите диапазон зарплат (например, 100000-150000): "
+            ).strip()
+            print_vacancies(
+                get_vacancies_by_salary(saver.get_vacancies(), salary_range)
+            )
+        elif choice == "6":
+            confirm = input("Удалить все сохранённые вакансии? (y/n): ").strip()
+            if confirm.lower() == "y":
+                saver.clear()
+                print("Сохранённые вакансии удалены.")
+        else:
+            print("Неверный пункт меню, попробуйте ещё раз.")
+        if not skip_continue_prompt:
+            input("\nНажмите Enter для продолжения...")
@@ -0,0 +1,93 @@
+import heapq
+import re
+import sys
+from operator import attrgetter
+
+from src.vacancy import Vacancy
+
+_SALARY_RE = re.compile(r"^\s*(\d+)\s*(?:-\s*(\d+))?\s*$")
+
+
+def filter_vacancies(
+    vacancies: list[Vacancy], filter_words: list[str]
+) -> list[Vacancy]:
+    """Отбирает вакансии, содержащие хотя бы одно из ключевых слов."""
+    if not filter_words:
+        return vacancies
+    filtered = []
+    for vacancy in vacancies:
+        text = (
+            f"{vacancy.name} {vacancy.description} {vacancy.requirements}".lower()
+        )
+        for word in filter_words:
+            if word.lower() in text:
+                filtered.append(vacancy)
+                break
+    return filtered
+
+
+def get_vacancies_by_salary(
+    vacancies: list[Vacancy], salary_range: str
+) -> list[Vacancy]:
+    """Отбирает вакансии по диапазону зарплат.
+
+    Диапазон задаётся строкой вида "100000" (минимальная средняя
+    зарплата) или "100000-150000" (границы вилки). При пустом или
+    некорректном вводе возвращается исходный список.
+    """
+    if not salary_range:
+        return vacancies
+    match = _SALARY_RE.match(salary_range)
+    if not match:
+        return vacancies
+    salary_from = int(match.group(1))
+    salary_to = int(match.group(2)) if match.group(2) else None
+    if salary_to is None:
+        return [
+            vacancy for vacancy in vacancies if vacancy._avg_salary >= salary_from
+        ]
+    return [
+        vacancy
+        for vacancy in vacancies
+        if vacancy.salary_from > 0
+        and vacancy.salary_to > 0
+        and vacancy.salary_from >= salary_from
+        and vacancy.salary_to <= salary_to
+    ]
+
+
+def sort_vacancies(vacancies: list[Vacancy]) -> list[Vacancy]:
+    """Сортирует вакансии по убыванию средней зарплаты."""
+    return sorted(vacancies, key=attrgetter("_avg_salary"), reverse=True)
+
+
+def get_top_vacancies(vacancies: list[Vacancy], top_n: int) -> list[Vacancy]:
+    """Возвращает top_n вакансий с наибольшей средней зарплатой.
+
+    Список не обязан быть отсортированным: heapq.nlargest выбирает
+    top_n элементов за O(N log top_n) вместо полной сортировки.
+    """
+    if top_n <= 0:
+        return vacancies
+    return heapq.nlargest(top_n, vacancies, key=attrgetter("_avg_salary"))
+
+
+_SEPARATOR = "=" * 80
+
+
+def print_vacancies(vacancies: list[Vacancy]) -> None:
+    """Выводит список вакансий в консоль одной записью в stdout."""
+    if not vacancies:
+        print("Нет вакансий для отображения.")
+        return
+    parts = [f"Найдено вакансий: {len(vacancies)}"]
+    for vacancy in vacancies:
+        parts.append(_SEPARATOR)
+        parts.extend(vacancy._format_lines())
+        if vacancy.requirements:
+            requirements = vacancy.requirements
+            if len(requirements) > 150:
+                requirements = requirements[:150] + "..."
+            parts.append(f"Требования: {requirements}")
+    parts.append(_SEPARATOR)
+    sys.stdout.write("\n".join(parts) + "\n")
@@ -0,0 +1,274 @@
+import hashlib
+import re
+from functools import total_ordering
+from typing import Any, Optional
+
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+
+_EMPTY: dict[str, Any] = {}
+
+
+@total_ordering
+class Vacancy:
+    """Класс для представления вакансии."""
+
+    __slots__ = (
+        "_id",
+        "_name",
+        "_url",
+        "_salary_from",
+        "_salary_to",
+        "_currency",
+        "_description",
+        "_requirements",
+        "_employer",
+        "_avg_salary",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        salary_from: Optional[int] = None,
+        salary_to: Optional[int] = None,
+        currency: Optional[str] = None,
+        description: Optional[str] = None,
+        requirements: Optional[str] = None,
+        employer: Optional[str] = None,
+        id: Optional[str] = None,
+    ) -> None:
+        self._name = name
+        self._url = url
+        self._salary_from, self._salary_to, self._currency = self._validate_salary(
+            salary_from, salary_to, currency
+        )
+        self._description, self._requirements = self._clean_text_fields(
+            description, requirements
+        )
+        self._employer = employer or "Не указано"
+        self._id = str(id) if id else self._generate_id()
+        self._avg_salary = (
+            0.0
+            if self._salary_from == 0 and self._salary_to == 0
+            else (self._salary_from + self._salary_to) / 2.0
+        )
+
+    @staticmethod
+    def _validate_salary(
+        salary_from: Optional[int],
+        salary_to: Optional[int],
+        currency: Optional[str],
+    ) -> tuple[int, int, str]:
+        """Приводит зарплату к целым числам, подставляя 0 вместо None."""
+        salary_from = int(salary_from) if salary_from else 0
+        salary_to = int(salary_to) if salary_to else 0
+        if salary_from and salary_to and salary_from > salary_to:
+            salary_from, salary_to = salary_to, salary_from
+        return salary_from, salary_to, currency or "RUR"
+
+    @classmethod
+    def _clean_text_fields(
+        cls, description: Optional[str], requirements: Optional[str]
+    ) -> tuple[str, str]:
+        """Очищает текстовые поля от HTML-тегов."""
+        return (
+            cls._remove_html_tags(description or ""),
+            cls._remove_html_tags(requirements or ""),
+        )
+
+    @staticmethod
+    def _remove_html_tags(text: str) -> str:
+        """Удаляет HTML-теги из текста."""
+        if "<" not in text:
+            return text
+        return _HTML_TAG_RE.sub("", text)
+
+    @classmethod
+    def _fast_new(
+        cls,
+        *,
+        name: Optional[str],
+        url: Optional[str],
+        salary_from: Optional[int],
+        salary_to: Optional[int],
+        currency: Optional[str],
+        description: Optional[str],
+        requirements: Optional[str],
+        employer: Optional[str],
+        id: Optional[str],
+    ) -> "Vacancy":
+        """Создаёт вакансию в обход __init__ для массовой загрузки.
+
+        Выполняет валидацию и очистку полей за один проход с прямой
+        записью в слоты — без цепочек вызовов методов на каждый объект.
+        """
+        self = object.__new__(cls)
+        self._name = name or "Не указано"
+        self._url = url or ""
+        sf = int(salary_from) if salary_from else 0
+        st = int(salary_to) if salary_to else 0
+        if sf and st and sf > st:
+            sf, st = st, sf
+        self._salary_from = sf
+        self._salary_to = st
+        self._currency = currency or "RUR"
+        text = description or ""
+        self._description = text if "<" not in text else _HTML_TAG_RE.sub("", text)
+        text = requirements or ""
+        self._requirements = text if "<" not in text else _HTML_TAG_RE.sub("", text)
+        self._employer = employer or "Не указано"
+        self._id = str(id) if id else self._generate_id()
+        self._avg_salary = 0.0 if sf == 0 and st == 0 else (sf + st) / 2.0
+        return self
+
+    def _generate_id(self) -> str:
+        """Генерирует стабильный идентификатор вакансии."""
+        data = f"{self._name}{self._url}{self._employer}"
+        return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def salary_from(self) -> int:
+        return self._salary_from
+
+    @property
+    def salary_to(self) -> int:
+        return self._salary_to
+
+    @property
+    def currency(self) -> str:
+        return self._currency
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def requirements(self) -> str:
+        return self._requirements
+
+    @property
+    def employer(self) -> str:
+        return self._employer
+
+    @property
+    def avg_salary(self) -> float:
+        """Средняя зарплата для сравнения и сортировки вакансий.
+
+        Вычисляется один раз в конструкторе: зарплата неизменяема, а
+        значение читается на каждом сравнении и при сортировке.
+        """
+        return self._avg_salary
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self._avg_salary == other._avg_salary
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self._avg_salary < other._avg_salary
+
+    def __hash__(self) -> int:
+        return hash(self._id)
+
+    def _format_lines(self) -> list[str]:
+        """Возвращает строки представления вакансии.
+
+        Общий формат для __repr__ и для utils.print_vacancies, чтобы не
+        собирать один и тот же текст дважды.
+        """
+        salary = (
+            f"Зарплата: {self._salary_from} - {self._salary_to} {self._currency}"
+            if self._salary_from or self._salary_to
+            else "Зарплата не указана"
+        )
+        return [
+            f"Вакансия: {self._name}",
+            f"Работодатель: {self._employer}",
+            salary,
+            f"Ссылка: {self._url}",
+        ]
+
+    def __repr__(self) -> str:
+        return "\n".join(self._format_lines())
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Возвращает словарь с данными вакансии для сериализации."""
+        return {
+            "id": self._id,
+            "name": self._name,
+            "url": self._url,
+            "salary_from": self._salary_from,
+            "salary_to": self._salary_to,
+            "currency": self._currency,
+            "description": self._description,
+            "requirements": self._requirements,
+            "employer": self._employer,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Vacancy":
+        """Создаёт вакансию из словаря, сохранённого в файле."""
+        return cls(
+            name=data.get("name", "Не указано"),
+            url=data.get("url", ""),
+            salary_from=data.get("salary_from"),
+            salary_to=data.get("salary_to"),
+            currency=data.get("currency"),
+            description=data.get("description"),
+            requirements=data.get("requirements"),
+            employer=data.get("employer"),
+            id=data.get("id"),
+        )
+
+    @classmethod
+    def cast_to_object_list(cls, vacancies_data: list[dict[str, Any]]) -> list["Vacancy"]:
+        """Преобразует список словарей из API HH.ru в список вакансий.
+
+        Повторяющиеся id (страницы выдачи могут пересекаться)
+        отсеиваются до создания объектов, чтобы не тратить работу на
+        дубликаты, которые всё равно будут отброшены при сохранении.
+        """
+        vacancies: list["Vacancy"] = []
+        append = vacancies.append
+        seen: set[str] = set()
+        for item in vacancies_data:
+            get = item.get
+            vacancy_id = get("id")
+            if vacancy_id is not None:
+                if vacancy_id in seen:
+                    continue
+                seen.add(vacancy_id)
+            salary = get("salary") or _EMPTY
+            snippet = get("snippet") or _EMPTY
+            employer = get("employer") or _EMPTY
+            append(
+                cls._fast_new(
+                    name=get("name"),
+                    url=get("alternate_url", ""),
+                    salary_from=salary.get("from"),
+                    salary_to=salary.get("to"),
+                    currency=salary.get("currency"),
+                    description=snippet.get("responsibility"),
+                    requirements=snippet.get("requirement"),
+                    employer=employer.get("name"),
+                    id=vacancy_id,
+                )
+            )
+        return vacancies
@@ -0,0 +1,261 @@
+import copy
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec, patch
+
+import orjson
+import pytest
+
+from src.api_hh import HeadHunterAPI
+from src.json_saver import JSONSaver
+from src.vacancy import Vacancy
+
+# Прогрев остальных тяжёлых модулей один раз на воркер xdist: тестовые
+# файлы берут их уже из sys.modules, а не импортируют каждый заново.
+import src.user_interaction  # noqa: E402,F401
+import src.utils  # noqa: E402,F401
+
+
+@pytest.fixture(scope="session")
+def sample_vacancy_data():
+    """Данные вакансии для проверки конструктора."""
+    return {
+        "name": "Python Developer",
+        "url": "https://hh.ru/vacancy/1",
+        "salary_from": 100000,
+        "salary_to": 150000,
+        "currency": "RUR",
+        "description": "<p>Разработка сервисов</p>",
+        "requirements": "Опыт Python от 3 лет",
+        "employer": "SkyPro",
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_vacancy(sample_vacancy_data):
+    return Vacancy(**sample_vacancy_data)
+
+
+@pytest.fixture(scope="session")
+def sample_vacancy_no_salary():
+    return Vacancy("Стажёр", "https://hh.ru/vacancy/2")
+
+
+@pytest.fixture(scope="session")
+def sample_vacancy_list():
+    """Три вакансии, покрывающие фильтры по ключевому слову и зарплате.
+
+    Кортеж, а не список: фикстура живёт всю сессию, и разделяемые
+    данные не должны случайно мутироваться тестом.
+    """
+    return (
+        Vacancy(
+            "Python Developer A",
+            "https://hh.ru/vacancy/10",
+            100000,
+            150000,
+            requirements="Python, Django",
+        ),
+        Vacancy(
+            "Python Developer B",
+            "https://hh.ru/vacancy/11",
+            80000,
+            120000,
+            requirements="Python, Flask",
+        ),
+        Vacancy(
+            "Java Developer",
+            "https://hh.ru/vacancy/12",
+            requirements="Java, Spring",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_api_response():
+    """Ответ API HH.ru с двумя вакансиями на одной странице.
+
+    Живёт всю сессию — тесты не должны изменять словарь на месте.
+    """
+    return {
+        "items": [
+            {
+                "id": "101",
+                "name": "Python Developer",
+                "alternate_url": "https://hh.ru/vacancy/101",
+                "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+                "snippet": {
+                    "requirement": "Опыт <highlighttext>Python</highlighttext>",
+                    "responsibility": "Разработка сервисов",
+                },
+                "employer": {"name": "SkyPro"},
+            },
+            {
+                "id": "102",
+                "name": "Junior Developer",
+                "alternate_url": "https://hh.ru/vacancy/102",
+                "salary": None,
+                "snippet": {"requirement": None, "responsibility": None},
+                "employer": {"name": "ACME"},
+            },
+        ],
+        "found": 2,
+        "pages": 1,
+        "page": 0,
+        "per_page": 100,
+    }
+
+
+@pytest.fixture(scope="module")
+def module_tmp(tmp_path_factory):
+    """Один временный каталог на модуль вместо mkdtemp на каждый тест."""
+    return tmp_path_factory.mktemp("saver_tests")
+
+
+@pytest.fixture
+def temp_json_file(module_tmp, request):
+    """Файл, уникальный для теста, в общем каталоге модуля."""
+    return module_tmp / f"{request.node.name}.json"
+
+
+@pytest.fixture(scope="session")
+def sample_vacancy_list_json(sample_vacancy_list):
+    """Сериализованный sample_vacancy_list — один раз на сессию."""
+    return json.dumps(
+        [vacancy.to_dict() for vacancy in sample_vacancy_list], ensure_ascii=False
+    ).encode()
+
+
+@pytest.fixture
+def preseeded_json_file(tmp_path, sample_vacancy_list_json):
+    """Файл с уже записанным sample_vacancy_list.
+
+    Тестам, которые только читают или удаляют, не нужно гонять
+    Vacancy.to_dict и сериализацию через JSONSaver — готовые байты
+    пишутся напрямую.
+    """
+    path = tmp_path / "vacancies.json"
+    path.write_bytes(sample_vacancy_list_json)
+    return path
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_real_session(request):
+    """Не даёт тестам API создавать настоящую requests.Session.
+
+    Конструктор сессии поднимает urllib3 PoolManager и монтирует
+    адаптеры — лишняя работа в юнит-тестах, где сеть всё равно замокана.
+    """
+    if request.module.__name__.endswith("test_api_hh"):
+        with patch("src.api_hh.requests.Session", return_value=Mock()) as patched:
+            yield patched
+    else:
+        yield
+
+
+@pytest.fixture
+def hh_api_with_mock_session(monkeypatch):
+    """HeadHunterAPI с замоканной сессией и фабрикой ответов.
+
+    Убирает повторяющуюся связку «мок сессии — мок ответа — подмена
+    requests.Session» из каждого теста API.
+    """
+    mock_session = Mock()
+    monkeypatch.setattr("src.api_hh.requests.Session", lambda: mock_session)
+    api = HeadHunterAPI()
+
+    def respond(payload, status=200):
+        response = Mock()
+        response.status_code = status
+        response.content = orjson.dumps(payload)
+        response.raise_for_status.return_value = None
+        mock_session.get.return_value = response
+        return response
+
+    return api, mock_session, respond
+
+
+@pytest.fixture(scope="session")
+def _mock_pool():
+    """Пул переиспользуемых Mock-объектов на всю сессию."""
+    return SimpleNamespace(
+        api=Mock(),
+        saver=Mock(),
+        response=Mock(),
+        vacancy=Mock(),
+        cast=Mock(),
+        print=Mock(),
+        filter=Mock(),
+    )
+
+
+@pytest.fixture
+def fresh_mocks(_mock_pool):
+    """Выдаёт пул моков и сбрасывает их после теста.
+
+    reset_mock в teardown дешевле, чем конструирование новых Mock()
+    в каждом тесте; к началу следующего теста пул уже чист.
+    """
+    yield _mock_pool
+    for mock in vars(_mock_pool).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def make_vacancy():
+    """Фабрика синтетических вакансий для тестов фильтров и сортировки.
+
+    Идёт через Vacancy._fast_new и подставляет url вместо хеша id:
+    без полного __init__ и blake2b на каждую из десятков тестовых
+    вакансий. Тесты самого конструктора продолжают звать Vacancy(...).
+    """
+
+    def factory(name, url, salary_from=0, salary_to=0):
+        return Vacancy._fast_new(
+            name=name,
+            url=url,
+            salary_from=salary_from,
+            salary_to=salary_to,
+            currency=None,
+            description=None,
+            requirements=None,
+            employer=None,
+            id=url,
+        )
+
+    return factory
+
+
+class VacancyStub:
+    """Лёгкая подмена Vacancy для тестов меню.
+
+    Автоспек интроспектирует класс и строит дерево дочерних моков;
+    стабу достаточно атрибутов, которые код меню реально читает.
+    """
+
+    __slots__ = ("name", "url", "_avg_salary")
+
+    def __init__(self, name="Test Vacancy", url="https://hh.ru/vacancy/0",
+                 avg_salary=0.0):
+        self.name = name
+        self.url = url
+        self._avg_salary = avg_salary
+
+
+@pytest.fixture
+def vacancy_stub():
+    """Стаб вакансии: тестам важна лишь его идентичность в списках."""
+    return VacancyStub()
+
+
+@pytest.fixture(scope="session")
+def _saver_mock_template():
+    return create_autospec(JSONSaver, instance=True)
+
+
+@pytest.fixture
+def saver_mock(_saver_mock_template):
+    """Копия шаблонного мока JSONSaver, сброшенная для текущего теста."""
+    mock = copy.copy(_saver_mock_template)
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import orjson
+import requests
+
+
+def _response(payload, status=200):
+    """Собирает мок HTTP-ответа с сериализованным JSON-телом."""
+    response = Mock()
+    response.status_code = status
+    response.content = orjson.dumps(payload)
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestHeadHunterAPI:
+    def test_request_method_success(self, hh_api_with_mock_session):
+        api, _session, respond = hh_api_with_mock_session
+        respond({"items": [], "pages": 1})
+        data = api._request(api.BASE_URL, {"page": 0})
+        assert data == {"items": [], "pages": 1}
+
+    def test_request_method_error(self, hh_api_with_mock_session):
+        api, session, _respond = hh_api_with_mock_session
+        session.get.side_effect = requests.RequestException
+        assert api._request(api.BASE_URL, {"page": 0}) is None
+
+    def test_request_method_non_dict_payload(self, hh_api_with_mock_session):
+        api, _session, respond = hh_api_with_mock_session
+        respond([1, 2, 3])
+        assert api._request(api.BASE_URL, {"page": 0}) is None
+
+    def test_get_vacancies_single_page(self, hh_api_with_mock_session):
+        api, session, respond = hh_api_with_mock_session
+        respond({"items": [{"id": "1"}], "pages": 1})
+        assert api.get_vacancies("python") == [{"id": "1"}]
+        session.get.assert_called_once()
+
+    def test_get_vacancies_multiple_pages(self, hh_api_with_mock_session):
+        api, session, _respond = hh_api_with_mock_session
+        pages = {
+            0: {"items": [{"id": "a"}], "pages": 3},
+            1: {"items": [{"id": "b"}], "pages": 3},
+            2: {"items": [{"id": "c"}], "pages": 3},
+        }
+        session.get.side_effect = lambda url, params=None, timeout=None: (
+            _response(pages[params["page"]])
+        )
+        vacancies = api.get_vacancies("python")
+        assert [item["id"] for item in vacancies] == ["a", "b", "c"]
+        assert session.get.call_count == 3
+
+    def test_get_vacancies_error_returns_empty(self, hh_api_with_mock_session):
+        api, session, _respond = hh_api_with_mock_session
+        session.get.side_effect = requests.RequestException
+        assert api.get_vacancies("python") == []
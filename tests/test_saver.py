@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from src.json_saver import JSONSaver
+from src.vacancy import Vacancy
+
+
+@pytest.fixture(scope="module")
+def seeded_json_saver(tmp_path_factory, sample_vacancy_list):
+    """Сейвер с загруженным sample_vacancy_list для read-only тестов."""
+    path = tmp_path_factory.mktemp("saver") / "vacancies.json"
+    saver = JSONSaver(str(path))
+    saver.add_vacancies(sample_vacancy_list)
+    return saver
+
+
+class TestJSONSaver:
+    def test_add_vacancy(self, temp_json_file, sample_vacancy):
+        saver = JSONSaver(str(temp_json_file))
+        saver.add_vacancy(sample_vacancy)
+        with open(temp_json_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert len(data) == 1
+        assert data[0]["name"] == "Python Developer"
+
+    def test_add_vacancy_no_duplicates(self, temp_json_file, sample_vacancy):
+        saver = JSONSaver(str(temp_json_file))
+        saver.add_vacancy(sample_vacancy)
+        saver.add_vacancy(sample_vacancy)
+        assert len(saver.get_vacancies()) == 1
+
+    def test_add_vacancies(self, temp_json_file, sample_vacancy_list):
+        saver = JSONSaver(str(temp_json_file))
+        saver.add_vacancies(sample_vacancy_list)
+        assert len(saver.get_vacancies()) == 3
+
+    def test_get_vacancies_all(self, preseeded_json_file):
+        saver = JSONSaver(str(preseeded_json_file))
+        vacancies = saver.get_vacancies()
+        assert len(vacancies) == 3
+        assert all(isinstance(v, Vacancy) for v in vacancies)
+
+    def test_get_vacancies_with_keyword_filter(self, seeded_json_saver):
+        filtered = seeded_json_saver.get_vacancies({"keyword": "python"})
+        assert len(filtered) == 2
+        assert all("Python" in v.name for v in filtered)
+
+    def test_get_vacancies_with_salary_filter(self, seeded_json_saver):
+        filtered = seeded_json_saver.get_vacancies({"salary_from": 90000})
+        assert [v.name for v in filtered] == ["Python Developer A"]
+
+    @pytest.mark.parametrize(
+        "idx,expected_names",
+        [
+            (0, {"Python Developer B", "Java Developer"}),
+            (1, {"Python Developer A", "Java Developer"}),
+            (2, {"Python Developer A", "Python Developer B"}),
+        ],
+    )
+    def test_delete_vacancy(
+        self, preseeded_json_file, sample_vacancy_list, idx, expected_names
+    ):
+        saver = JSONSaver(str(preseeded_json_file))
+        saver.delete_vacancy(sample_vacancy_list[idx])
+        assert {v.name for v in saver.get_vacancies()} == expected_names
+
+    def test_get_vacancies_malformed_file(self, temp_json_file):
+        temp_json_file.write_text("не json", encoding="utf-8")
+        saver = JSONSaver(str(temp_json_file))
+        # Битый файл деградирует в пустой список на обоих путях чтения.
+        assert saver.get_vacancies() == []
+        assert saver.get_vacancies({"keyword": "python"}) == []
+
+    def test_delete_missing_vacancy(self, temp_json_file, sample_vacancy):
+        saver = JSONSaver(str(temp_json_file))
+        saver.delete_vacancy(sample_vacancy)
+        assert saver.get_vacancies() == []
+
+    def test_clear(self, temp_json_file, sample_vacancy_list):
+        saver = JSONSaver(str(temp_json_file))
+        saver.add_vacancies(sample_vacancy_list)
+        saver.clear()
+        assert saver.get_vacancies() == []
@@ -0,0 +1,212 @@
+import io
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+# Класс кешируется один раз: подмена метода по готовой ссылке не гоняет
+# резолв строки "src.user_interaction.Vacancy.cast_to_object_list" в
+# каждом тесте. Это тот же объект, что и Vacancy внутри user_interaction.
+from src.vacancy import Vacancy as _UiVacancy
+
+
+@pytest.fixture
+def user_interaction_fn():
+    """Отдаёт user_interaction, уже прогретый импортом в conftest.
+
+    Импорт внутри фикстуры — это только выборка из sys.modules;
+    тестам не нужно держать собственный import на уровне модуля.
+    """
+    from src.user_interaction import user_interaction
+
+    return user_interaction
+
+
+def assert_one_call(mock, *args):
+    """Проверяет один вызов мока с заданными позиционными аргументами.
+
+    Прямое сравнение call_args.args без связывания сигнатуры, которое
+    делает assert_called_once_with на каждом вызове.
+    """
+    assert mock.call_count == 1
+    assert mock.call_args.args == args
+
+
+def quick_exit(action_inputs):
+    """Входы действия плюс немедленный выход из меню.
+
+    Вместе с user_interaction(skip_continue_prompt=True) убирает
+    Enter-паузу и вторую итерацию меню из каждого теста.
+    """
+    return [*action_inputs, "0"]
+
+
+def scripted_input(monkeypatch, inputs):
+    """Подменяет builtins.input на заранее заданный поток строк.
+
+    Простая лямбда поверх итератора: без учёта вызовов и прочей
+    бухгалтерии Mock(side_effect=...) на каждый prompt.
+    """
+    it = iter(inputs)
+    monkeypatch.setattr("builtins.input", lambda *a, **kw: next(it))
+
+
+class TestUserInteraction:
+    @pytest.fixture(autouse=True)
+    def mock_deps(self, monkeypatch):
+        """Подменяет HeadHunterAPI и JSONSaver для всех тестов класса.
+
+        Один monkeypatch вместо пары @patch-декораторов на каждом тесте:
+        без повторного резолва целей и enter/exit на каждый тест.
+        """
+        deps = SimpleNamespace(api_class=Mock(), saver_class=Mock())
+        monkeypatch.setattr("src.user_interaction.HeadHunterAPI", deps.api_class)
+        monkeypatch.setattr("src.user_interaction.JSONSaver", deps.saver_class)
+        return deps
+
+    @pytest.fixture
+    def silent_output(self, monkeypatch):
+        """Глушит вывод меню в тестах, которые не проверяют stdout.
+
+        print становится no-op, а sys.stdout — StringIO, чтобы строки
+        меню не копились в буфере capture на каждой итерации цикла.
+        """
+        monkeypatch.setattr("builtins.print", lambda *a, **k: None)
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+
+    def test_menu_exit(
+        self,
+        mock_deps,
+        user_interaction_fn,
+        monkeypatch,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        scripted_input(monkeypatch, quick_exit([]))
+        user_interaction_fn(skip_continue_prompt=True)
+        captured = capsys.readouterr()
+        assert "До свидания!" in captured.out
+
+    def test_menu_invalid_choice(
+        self,
+        mock_deps,
+        user_interaction_fn,
+        monkeypatch,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        scripted_input(monkeypatch, quick_exit(["9"]))
+        user_interaction_fn(skip_continue_prompt=True)
+        captured = capsys.readouterr()
+        assert "Неверный пункт меню" in captured.out
+
+    def test_menu_option_1_search_vacancies(
+        self,
+        mock_deps,
+        user_interaction_fn,
+        saver_mock,
+        vacancy_stub,
+        fresh_mocks,
+        silent_output,
+        monkeypatch,
+    ):
+        mock_deps.api_class.return_value.get_vacancies.return_value = [{"id": "1"}]
+        mock_deps.saver_class.return_value = saver_mock
+        mock_cast = fresh_mocks.cast
+        mock_cast.return_value = [vacancy_stub]
+        monkeypatch.setattr(_UiVacancy, "cast_to_object_list", mock_cast)
+        mock_print = fresh_mocks.print
+        monkeypatch.setattr("src.user_interaction.print_vacancies", mock_print)
+        scripted_input(monkeypatch, quick_exit(["1", "python"]))
+        user_interaction_fn(skip_continue_prompt=True)
+        assert_one_call(
+            mock_deps.api_class.return_value.get_vacancies, "python"
+        )
+        assert_one_call(mock_cast, [{"id": "1"}])
+        assert_one_call(saver_mock.add_vacancies, [vacancy_stub])
+        assert_one_call(mock_print, [vacancy_stub])
+
+    @pytest.mark.parametrize(
+        "query,api_result,expected",
+        [
+            ("", None, "Запрос не может быть пустым."),
+            ("python", [], "По запросу ничего не найдено."),
+        ],
+        ids=["empty_query", "no_results"],
+    )
+    def test_menu_option_1_without_results(
+        self,
+        mock_deps,
+        query,
+        api_result,
+        expected,
+        user_interaction_fn,
+        monkeypatch,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        mock_deps.api_class.return_value.get_vacancies.return_value = api_result
+        scripted_input(monkeypatch, quick_exit(["1", query]))
+        user_interaction_fn(skip_continue_prompt=True)
+        captured = capsys.readouterr()
+        assert expected in captured.out
+        if api_result is None:
+            mock_deps.api_class.return_value.get_vacancies.assert_not_called()
+
+    MENU_SCENARIOS = {
+        "show_saved": {"inputs": ["2"]},
+        "search_by_keyword": {"inputs": ["3", "python"]},
+        "top_n": {"inputs": ["4", "5"]},
+        "filter_by_salary": {"inputs": ["5", "100000-150000"]},
+        "clear": {"inputs": ["6", "y"], "cleared": True},
+        "clear_cancel": {"inputs": ["6", "n"], "cleared": False},
+    }
+
+    @pytest.mark.parametrize("scenario", sorted(MENU_SCENARIOS))
+    def test_menu_actions(
+        self,
+        mock_deps,
+        scenario,
+        user_interaction_fn,
+        saver_mock,
+        vacancy_stub,
+        fresh_mocks,
+        silent_output,
+        monkeypatch,
+    ):
+        spec = self.MENU_SCENARIOS[scenario]
+        saver_mock.get_vacancies.return_value = [vacancy_stub]
+        mock_deps.saver_class.return_value = saver_mock
+        mock_filter = fresh_mocks.filter
+        mock_filter.return_value = [vacancy_stub]
+        monkeypatch.setattr(
+            "src.user_interaction.get_vacancies_by_salary", mock_filter
+        )
+        mock_print = fresh_mocks.print
+        monkeypatch.setattr("src.user_interaction.print_vacancies", mock_print)
+        scripted_input(monkeypatch, quick_exit(spec["inputs"]))
+        user_interaction_fn(skip_continue_prompt=True)
+        choice = spec["inputs"][0]
+        if choice == "6":
+            if spec["cleared"]:
+                assert saver_mock.clear.call_count == 1
+            else:
+                saver_mock.clear.assert_not_called()
+            return
+        assert_one_call(mock_print, [vacancy_stub])
+        if choice == "3":
+            assert_one_call(saver_mock.get_vacancies, {"keyword": "python"})
+        elif choice == "5":
+            assert_one_call(mock_filter, [vacancy_stub], "100000-150000")
+        else:
+            assert_one_call(saver_mock.get_vacancies)
+
+    def test_menu_option_4_invalid_number(
+        self,
+        mock_deps,
+        user_interaction_fn,
+        monkeypatch,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        scripted_input(monkeypatch, quick_exit(["4", "abc"]))
+        user_interaction_fn(skip_continue_prompt=True)
+        captured = capsys.readouterr()
+        assert "Некорректное число." in captured.out
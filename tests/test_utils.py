@@ -0,0 +1,160 @@
+import re
+
+import pytest
+
+from src.utils import (
+    filter_vacancies,
+    get_top_vacancies,
+    get_vacancies_by_salary,
+    print_vacancies,
+    sort_vacancies,
+)
+from src.vacancy import Vacancy
+
+
+class TestFilterVacancies:
+    def test_filter_by_keyword_in_name(self, sample_vacancy_list):
+        filtered = filter_vacancies(sample_vacancy_list, ["python"])
+        assert len(filtered) == 2
+
+    def test_filter_vacancies_in_description(self):
+        vacancy = Vacancy("Dev", "url", description="Разработка на Django")
+        assert filter_vacancies([vacancy], ["django"]) == [vacancy]
+
+    def test_filter_no_match(self, sample_vacancy_list):
+        assert filter_vacancies(sample_vacancy_list, ["golang"]) == []
+
+    def test_filter_empty_words(self, sample_vacancy_list):
+        assert filter_vacancies(sample_vacancy_list, []) is sample_vacancy_list
+
+
+@pytest.fixture(scope="module")
+def salary_trio(make_vacancy):
+    """Три вакансии с фиксированными зарплатами для таблицы фильтра."""
+    return (
+        make_vacancy("Dev1", "url1", 100000, 150000),
+        make_vacancy("Dev2", "url2", 80000, 120000),
+        make_vacancy("Dev3", "url3"),
+    )
+
+
+class TestGetVacanciesBySalary:
+    @pytest.mark.parametrize(
+        "range_str,expected_idxs",
+        [
+            ("", [0, 1, 2]),
+            ("100000", [0, 1]),
+            (" 100000 ", [0, 1]),
+            ("90000-160000", [0]),
+            ("50000-200000", [0, 1]),
+            ("invalid-range", [0, 1, 2]),
+        ],
+        ids=[
+            "empty_returns_all",
+            "single_value",
+            "single_value_with_spaces",
+            "range",
+            "range_excludes_unspecified",
+            "invalid_returns_all",
+        ],
+    )
+    def test_filter(self, salary_trio, range_str, expected_idxs):
+        vacancies = list(salary_trio)
+        filtered = get_vacancies_by_salary(vacancies, range_str)
+        # Сравнение по id(): Vacancy.__eq__ сравнивает средние зарплаты,
+        # поэтому == не отличает разные вакансии с одинаковой вилкой.
+        assert [id(v) for v in filtered] == [
+            id(vacancies[i]) for i in expected_idxs
+        ]
+        if len(expected_idxs) == len(vacancies):
+            # Пустой или нераспознанный диапазон возвращает исходный список.
+            assert filtered is vacancies
+
+
+class TestSortVacancies:
+    def test_sort_by_avg_salary_desc(self, make_vacancy):
+        vacancy1 = make_vacancy("Dev1", "url1", 50000, 70000)
+        vacancy2 = make_vacancy("Dev2", "url2", 100000, 150000)
+        vacancy3 = make_vacancy("Dev3", "url3")
+        sorted_vacancies = sort_vacancies([vacancy1, vacancy2, vacancy3])
+        assert [v.name for v in sorted_vacancies] == ["Dev2", "Dev1", "Dev3"]
+
+    def test_sort_empty_list(self):
+        assert sort_vacancies([]) == []
+
+
+@pytest.fixture(scope="module")
+def top_vacancies(make_vacancy):
+    """Один общий список на все варианты top-N: тесты его не изменяют."""
+    return [
+        make_vacancy("Dev1", "url1", 100000, 150000),
+        make_vacancy("Dev2", "url2", 80000, 120000),
+        make_vacancy("Dev3", "url3", 50000, 70000),
+    ]
+
+
+class TestGetTopVacancies:
+    @pytest.mark.parametrize(
+        "n,expected_names",
+        [
+            (2, ["Dev1", "Dev2"]),
+            (5, ["Dev1", "Dev2", "Dev3"]),
+            (0, None),
+            (-1, None),
+        ],
+        ids=["top_two", "more_than_available", "zero", "negative"],
+    )
+    def test_get_top(self, top_vacancies, n, expected_names):
+        top = get_top_vacancies(top_vacancies, n)
+        if expected_names is None:
+            # n <= 0 возвращает исходный список без копирования.
+            assert top is top_vacancies
+        else:
+            assert [v.name for v in top] == expected_names
+
+
+class TestPrintVacancies:
+    def test_print_empty_list(self, capsys):
+        print_vacancies([])
+        captured = capsys.readouterr()
+        assert "Нет вакансий для отображения." in captured.out
+
+    # Все ожидаемые фрагменты ищутся одним проходом альтернацией,
+    # а не десятком независимых сканов captured.out.
+    EXPECTED_FRAGMENTS = (
+        "Найдено вакансий: 2",
+        "Python Developer A",
+        "Python Developer B",
+        "Зарплата: 100000 - 150000 RUR",
+        "Зарплата: 80000 - 120000 RUR",
+        "https://hh.ru/vacancy/10",
+        "https://hh.ru/vacancy/11",
+        "Python, Django",
+        "Python, Flask",
+        "Требования:",
+        "=" * 80,
+    )
+    _FRAGMENTS_RE = re.compile("|".join(map(re.escape, EXPECTED_FRAGMENTS)))
+
+    def test_print_vacancies_with_data(self, sample_vacancy_list, capsys):
+        print_vacancies(sample_vacancy_list[:2])
+        output = capsys.readouterr().out
+        found = set(self._FRAGMENTS_RE.findall(output))
+        assert found == set(self.EXPECTED_FRAGMENTS)
+        assert "Зарплата не указана" not in output
+
+    def test_print_vacancies_no_salary(self, sample_vacancy_no_salary, capsys):
+        print_vacancies([sample_vacancy_no_salary])
+        captured = capsys.readouterr()
+        assert "Зарплата не указана" in captured.out
+
+    def test_print_vacancies_truncated_requirements(self, capsys):
+        # 165 символов — минимум, превышающий порог усечения в 150;
+        # более длинная строка только раздувает буфер capsys.
+        long_requirements = "Требование " * 15
+        vacancy = Vacancy("Dev", "url", requirements=long_requirements)
+        print_vacancies([vacancy])
+        output = capsys.readouterr().out
+        assert "Требования: " + long_requirements[:150] + "..." in output
+        # Шапка, два разделителя, карточка и усечённые требования.
+        assert len(output) <= 450
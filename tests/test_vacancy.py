@@ -0,0 +1,81 @@
+import pytest
+
+from src.vacancy import Vacancy
+
+
+class TestVacancy:
+    def test_init(self, sample_vacancy_data):
+        vacancy = Vacancy(**sample_vacancy_data)
+        assert vacancy.name == "Python Developer"
+        assert vacancy.url == "https://hh.ru/vacancy/1"
+        assert vacancy.salary_from == 100000
+        assert vacancy.salary_to == 150000
+        assert vacancy.currency == "RUR"
+        assert vacancy.description == "Разработка сервисов"
+        assert vacancy.employer == "SkyPro"
+
+    def test_init_no_salary(self, sample_vacancy_no_salary):
+        assert sample_vacancy_no_salary.salary_from == 0
+        assert sample_vacancy_no_salary.salary_to == 0
+        assert sample_vacancy_no_salary.avg_salary == 0.0
+
+    def test_salary_bounds_swapped(self):
+        vacancy = Vacancy("Dev", "url", 150000, 100000)
+        assert vacancy.salary_from == 100000
+        assert vacancy.salary_to == 150000
+
+    HTML_SAMPLES = [
+        ("<p>Опыт <b>Python</b></p>", "Опыт Python"),
+        ("Опыт <highlighttext>Python</highlighttext>", "Опыт Python"),
+        ("без тегов", "без тегов"),
+        ("", ""),
+    ]
+
+    @pytest.mark.parametrize("raw,expected", HTML_SAMPLES)
+    def test_remove_html_tags(self, raw, expected):
+        assert Vacancy._remove_html_tags(raw) == expected
+
+    def test_generated_id(self, sample_vacancy):
+        assert len(sample_vacancy.id) == 32
+
+    def test_explicit_id_preserved(self):
+        vacancy = Vacancy("Dev", "url", id="12345")
+        assert vacancy.id == "12345"
+
+    def test_avg_salary(self, sample_vacancy):
+        assert sample_vacancy.avg_salary == 125000.0
+
+    def test_comparison_operators(self, sample_vacancy, sample_vacancy_no_salary):
+        assert sample_vacancy_no_salary < sample_vacancy
+        assert sample_vacancy > sample_vacancy_no_salary
+        assert sample_vacancy >= sample_vacancy_no_salary
+        assert sample_vacancy_no_salary <= sample_vacancy
+        assert sample_vacancy != sample_vacancy_no_salary
+
+    def test_to_dict_from_dict_roundtrip(self, sample_vacancy):
+        restored = Vacancy.from_dict(sample_vacancy.to_dict())
+        assert restored.id == sample_vacancy.id
+        assert restored.name == sample_vacancy.name
+        assert restored.salary_from == sample_vacancy.salary_from
+        assert restored.requirements == sample_vacancy.requirements
+
+    def test_str_representation(self, sample_vacancy):
+        text = str(sample_vacancy)
+        assert "Python Developer" in text
+        assert "SkyPro" in text
+        assert "100000" in text
+
+    def test_cast_to_object_list(self, sample_api_response):
+        vacancies = Vacancy.cast_to_object_list(sample_api_response["items"])
+        assert len(vacancies) == 2
+        assert all(isinstance(v, Vacancy) for v in vacancies)
+        first = vacancies[0]
+        assert first.id == "101"
+        assert first.name == "Python Developer"
+        assert first.requirements == "Опыт Python"
+        assert first.employer == "SkyPro"
+        assert vacancies[1].salary_from == 0
+
+    def test_cast_to_object_list_deduplicates(self, sample_api_response):
+        items = sample_api_response["items"] + [sample_api_response["items"][0]]
+        assert len(Vacancy.cast_to_object_list(items)) == 2